@@ -9,32 +9,169 @@ This script:
 4. Recommends updates to newer stable versions
 """
 
+from __future__ import annotations
+
+import functools
+import json
 import sys
-from datetime import datetime, timedelta
+import tempfile
+from datetime import date, datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, NoReturn, cast
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    tomllib = None
 
-try:
+# requests and packaging are imported where they are used, so that runs which
+# exit early never pay for loading them
+if TYPE_CHECKING:
     import requests
-    from packaging.specifiers import InvalidSpecifier, SpecifierSet
     from packaging.version import Version
-except ImportError:
+
+EOL_API_URL = "https://endoflife.date/api/python.json"
+
+REPORT_PATH = Path("python-version-report.txt")
+
+# On-disk copy of the last API response, revalidated with ETag/Last-Modified
+CACHE_PATH = Path(tempfile.gettempdir()) / "python_eol.json"
+CACHE_META_PATH = Path(tempfile.gettempdir()) / "python_eol.meta.json"
+
+
+def _exit_missing_dependencies() -> NoReturn:
+    """Report missing third-party packages and exit."""
     print("ERROR: Required packages not installed. Run: pip install requests packaging")
     sys.exit(1)
 
 
+@functools.cache
+def _get_session() -> requests.Session:
+    """Return a shared session so repeated requests reuse a pooled connection."""
+    try:
+        import requests
+    except ImportError:
+        _exit_missing_dependencies()
+    return requests.Session()
+
+
+def _load_cache_headers() -> dict[str, str]:
+    """Build conditional request headers from the cached response metadata."""
+    if not (CACHE_PATH.exists() and CACHE_META_PATH.exists()):
+        return {}
+
+    try:
+        meta = json.loads(CACHE_META_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _save_cache(response: requests.Response) -> None:
+    """Persist the response body and its validators for later revalidation."""
+    try:
+        CACHE_PATH.write_text(response.text, encoding="utf-8")
+        CACHE_META_PATH.write_text(
+            json.dumps(
+                {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+            ),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        print(f"WARNING: Could not write EOL data cache: {e}", file=sys.stderr)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_version(version_str: str) -> Version:
+    """Parse a version string, reusing earlier results for repeated comparisons."""
+    try:
+        from packaging.version import Version
+    except ImportError:
+        _exit_missing_dependencies()
+    return Version(version_str)
+
+
+def _release_key(version_str: str) -> tuple[int, ...] | None:
+    """Return a comparable key for a plain numeric version like "3.10".
+
+    Trailing zero components are dropped so "3.10" and "3.10.0" compare equal,
+    as they do for packaging's Version. Returns None for anything else.
+    """
+    parts = version_str.split(".")
+    if not all(part.isdigit() for part in parts):
+        return None
+    key = [int(part) for part in parts]
+    while len(key) > 1 and key[-1] == 0:
+        key.pop()
+    return tuple(key)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_iso_date(date_str: str) -> date:
+    """Parse a YYYY-MM-DD date string, accepting unpadded months and days.
+
+    Raises:
+        ValueError: If the string is not a valid date
+    """
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+    # Same formats the original strptime parse accepted, e.g. "2020-1-5"
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+
 def fetch_python_eol_data() -> list[dict[str, Any]]:
-    """Fetch Python EOL data from endoflife.date API."""
-    url = "https://endoflife.date/api/python.json"
+    """Fetch Python EOL data from endoflife.date API.
+
+    Sends a conditional request when a cached copy is available and reuses
+    the cached body if the server answers 304 Not Modified.
+    """
+    session = _get_session()
+    import requests
+
+    url = EOL_API_URL
     try:
-        response = requests.get(url, timeout=10)
+        response = session.get(url, headers=_load_cache_headers(), timeout=10)
+        if response.status_code == 304:
+            try:
+                return cast(
+                    list[dict[str, Any]],
+                    json.loads(CACHE_PATH.read_text(encoding="utf-8")),
+                )
+            except (OSError, ValueError):
+                # Cache vanished or is corrupt; fall back to a full download
+                response = session.get(url, timeout=10)
         response.raise_for_status()
+        _save_cache(response)
         return cast(list[dict[str, Any]], response.json())
     except requests.RequestException as e:
         print(f"ERROR: Failed to fetch Python EOL data: {e}")
         sys.exit(1)
 
 
+def _scan_requires_python(content: str) -> str | None:
+    """Find requires-python with a simple line scan (fallback for Python 3.10)."""
+    for line in content.split("\n"):
+        if "requires-python" in line.lower():
+            # Extract version specifier: requires-python = ">=3.10"
+            parts = line.split("=", 1)
+            if len(parts) == 2:
+                return parts[1].strip().strip('"').strip("'")
+    return None
+
+
 def parse_pyproject_toml() -> dict[str, Any]:
     """Parse pyproject.toml to extract Python version requirements."""
     pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
@@ -45,15 +182,16 @@ def parse_pyproject_toml() -> dict[str, Any]:
 
     content = pyproject_path.read_text(encoding="utf-8")
 
-    # Simple parser for requires-python field
     requires_python = None
-    for line in content.split("\n"):
-        if "requires-python" in line.lower():
-            # Extract version specifier: requires-python = ">=3.10"
-            parts = line.split("=", 1)
-            if len(parts) == 2:
-                requires_python = parts[1].strip().strip('"').strip("'")
-                break
+    if tomllib is not None:
+        try:
+            project = tomllib.loads(content).get("project", {})
+            requires_python = project.get("requires-python")
+        except tomllib.TOMLDecodeError as e:
+            print(f"WARNING: Could not parse pyproject.toml: {e}", file=sys.stderr)
+
+    if not requires_python:
+        requires_python = _scan_requires_python(content)
 
     if not requires_python:
         print("ERROR: Could not find requires-python in pyproject.toml")
@@ -65,6 +203,11 @@ def parse_pyproject_toml() -> dict[str, Any]:
 
 def get_minimum_version(specifier_str: str) -> str | None:
     """Extract minimum Python version from specifier."""
+    try:
+        from packaging.specifiers import InvalidSpecifier, SpecifierSet
+    except ImportError:
+        _exit_missing_dependencies()
+
     try:
         spec = SpecifierSet(specifier_str)
         # Look for >= or > operators
@@ -83,15 +226,17 @@ def check_eol_status(
     today = datetime.now().date()
     warning_threshold = today + timedelta(days=180)  # 6 months warning
     maturity_threshold = timedelta(days=90)  # Only recommend versions 90+ days old
-
-    results: dict[str, Any] = {
-        "min_version": min_version,
-        "eol_versions": [],
-        "approaching_eol": [],
-        "latest_stable": None,
-        "latest_mature": None,
-        "recommendations": [],
-    }
+    min_v = _parse_version(min_version)
+    min_key = _release_key(min_version)
+    today_iso = today.isoformat()
+    from packaging.version import InvalidVersion
+
+    # Candidates are (parsed version, details) pairs; winners are picked once
+    # after the loop instead of re-comparing against the current best each time
+    stable_candidates: list[tuple[Version, dict[str, Any]]] = []
+    mature_candidates: list[tuple[Version, dict[str, Any]]] = []
+    eol_versions: list[dict[str, Any]] = []
+    approaching_eol: list[dict[str, Any]] = []
 
     for version_data in eol_data:
         cycle = version_data.get("cycle", "")
@@ -103,8 +248,26 @@ def check_eol_status(
         if not eol_date_str or eol_date_str == "false":
             continue
 
+        # If the cycle does not contain a dot, assume it is a minor version
+        # (e.g., "10" -> "3.10"). This is based on current API behavior for
+        # Python 3.x. If Python 4.x cycles appear, update this logic for
+        # major version transitions.
+        version_str = f"3.{cycle}" if "." not in cycle else cycle
+
+        # Cycles below the minimum version that are already EOL cannot affect
+        # any result, so skip them before parsing dates or versions. ISO date
+        # strings compare correctly as plain strings.
+        if (
+            min_key is not None
+            and isinstance(eol_date_str, str)
+            and eol_date_str <= today_iso
+        ):
+            version_key = _release_key(version_str)
+            if version_key is not None and version_key < min_key:
+                continue
+
         try:
-            eol_date = datetime.strptime(eol_date_str, "%Y-%m-%d").date()
+            eol_date = _parse_iso_date(eol_date_str)
         except ValueError:
             continue
 
@@ -112,7 +275,7 @@ def check_eol_status(
         release_date = None
         if release_date_str:
             try:
-                release_date = datetime.strptime(release_date_str, "%Y-%m-%d").date()
+                release_date = _parse_iso_date(release_date_str)
             except ValueError:
                 print(
                     f"WARNING: Failed to parse release date "
@@ -120,244 +283,248 @@ def check_eol_status(
                     file=sys.stderr,
                 )
 
-        # If the cycle does not contain a dot, assume it is a minor version
-        # (e.g., "10" -> "3.10"). This is based on current API behavior for
-        # Python 3.x. If Python 4.x cycles appear, update this logic for
-        # major version transitions.
-        version_str = f"3.{cycle}" if "." not in cycle else cycle
+        try:
+            version = _parse_version(version_str)
+        except InvalidVersion:
+            # Skip versions with invalid version strings
+            continue
 
-        # Track latest stable (non-EOL) version
-        if eol_date > today and (
-            results["latest_stable"] is None
-            or Version(version_str) > Version(results["latest_stable"]["version"])
-        ):
-            results["latest_stable"] = {
-                "version": version_str,
-                "latest_patch": latest,
-                "eol_date": eol_date_str,
-                "lts": lts,
-                "release_date": release_date_str,
-            }
-
-        # Track latest mature version (released 90+ days ago)
-        if release_date is not None:
-            is_mature = (today - release_date) >= maturity_threshold
-            if (
-                eol_date > today
-                and is_mature
-                and (
-                    results["latest_mature"] is None
-                    or Version(version_str)
-                    > Version(results["latest_mature"]["version"])
+        # Track stable (non-EOL) versions
+        if eol_date > today:
+            stable_candidates.append(
+                (
+                    version,
+                    {
+                        "version": version_str,
+                        "latest_patch": latest,
+                        "eol_date": eol_date_str,
+                        "lts": lts,
+                        "release_date": release_date_str,
+                    },
                 )
-            ):
-                results["latest_mature"] = {
-                    "version": version_str,
-                    "latest_patch": latest,
-                    "eol_date": eol_date_str,
-                    "lts": lts,
-                    "release_date": release_date_str,
-                    "days_since_release": (today - release_date).days,
-                }
+            )
 
-        # Check if versions in our supported range are EOL or approaching EOL
-        try:
-            if Version(version_str) >= Version(min_version):
-                if eol_date < today:
-                    results["eol_versions"].append(
-                        {
-                            "version": version_str,
-                            "latest_patch": latest,
-                            "eol_date": eol_date_str,
-                            "days_past_eol": (today - eol_date).days,
-                        }
-                    )
-                elif eol_date < warning_threshold:
-                    results["approaching_eol"].append(
+            # Track mature versions (released 90+ days ago)
+            if release_date is not None and (
+                today - release_date >= maturity_threshold
+            ):
+                mature_candidates.append(
+                    (
+                        version,
                         {
                             "version": version_str,
                             "latest_patch": latest,
                             "eol_date": eol_date_str,
-                            "days_until_eol": (eol_date - today).days,
-                        }
+                            "lts": lts,
+                            "release_date": release_date_str,
+                            "days_since_release": (today - release_date).days,
+                        },
                     )
-        except (ValueError, TypeError):
-            # Skip versions with invalid version strings
-            continue
+                )
+
+        # Check if versions in our supported range are EOL or approaching EOL
+        if version >= min_v:
+            if eol_date < today:
+                eol_versions.append(
+                    {
+                        "version": version_str,
+                        "latest_patch": latest,
+                        "eol_date": eol_date_str,
+                        "days_past_eol": (today - eol_date).days,
+                    }
+                )
+            elif eol_date < warning_threshold:
+                approaching_eol.append(
+                    {
+                        "version": version_str,
+                        "latest_patch": latest,
+                        "eol_date": eol_date_str,
+                        "days_until_eol": (eol_date - today).days,
+                    }
+                )
+
+    latest_stable = max(stable_candidates, key=itemgetter(0), default=None)
+    latest_mature = max(mature_candidates, key=itemgetter(0), default=None)
+
+    return {
+        "min_version": min_version,
+        "eol_versions": eol_versions,
+        "approaching_eol": approaching_eol,
+        "latest_stable": latest_stable[1] if latest_stable else None,
+        "latest_mature": latest_mature[1] if latest_mature else None,
+        "recommendations": [],
+    }
+
+
+_BRANCH_PROTECTION_AND_ACTIONS = """\
+## ⚠️ Branch Protection Consideration
 
-    return results
+If you have branch protection rules that require specific CI checks \
+(e.g., `test (3.10)`), you may need to update those rules when adding \
+or removing Python versions from the CI matrix.
+
+See `docs/PYTHON_VERSION_MANAGEMENT.md` for guidance on managing \
+branch protection rules.
+
+## 🔧 Action Items
+
+- [ ] Update `pyproject.toml` `requires-python` field
+- [ ] Update `pyproject.toml` classifiers
+- [ ] Update instruction files (`.github/copilot-instructions.md`, `agents.md`)
+- [ ] Update GitHub Actions workflows (`.github/workflows/*.yml`) \
+Python version matrices
+- [ ] Update GitHub branch protection rules (if using specific CI checks)
+- [ ] Test with new Python version
+- [ ] Update documentation"""
+
+_STATUS_OK = """\
+## ✅ Status: OK
+
+All supported Python versions are current and not approaching EOL."""
+
+_REPORT_FOOTER = """
+---
+*This report is generated automatically by \
+`.github/workflows/python-version-check.yml`*"""
 
 
 def generate_report(results: dict[str, Any], pyproject_info: dict[str, Any]) -> str:
     """Generate a human-readable report."""
-    lines = []
-    lines.append("# Python Version EOL Status Report")
-    lines.append("")
-    lines.append(f"**Report Date:** {datetime.now().strftime('%Y-%m-%d')}")
-    lines.append(f"**Project Requirement:** `{pyproject_info['requires_python']}`")
-    lines.append(f"**Minimum Version:** Python {results['min_version']}")
-    lines.append("")
+    # Each section ends with its own trailing blank line where one is needed;
+    # sections are joined with single newlines.
+    sections = [
+        f"""\
+# Python Version EOL Status Report
+
+**Report Date:** {datetime.now().strftime("%Y-%m-%d")}
+**Project Requirement:** `{pyproject_info["requires_python"]}`
+**Minimum Version:** Python {results["min_version"]}
+"""
+    ]
 
-    has_issues = False
+    has_issues = bool(results["eol_versions"] or results["approaching_eol"])
 
     # EOL versions
     if results["eol_versions"]:
-        has_issues = True
-        lines.append("## ⚠️ End-of-Life Versions")
-        lines.append("")
-        lines.append(
-            "The following Python versions in your supported range are **already EOL**:"
+        bullets = "\n".join(
+            f"- **Python {v['version']}** (latest: {v['latest_patch']})\n"
+            f"  - EOL Date: {v['eol_date']}\n"
+            f"  - Days past EOL: **{v['days_past_eol']} days**"
+            for v in results["eol_versions"]
+        )
+        sections.append(
+            "## ⚠️ End-of-Life Versions\n\n"
+            "The following Python versions in your supported range are "
+            f"**already EOL**:\n\n{bullets}\n"
         )
-        lines.append("")
-        for v in results["eol_versions"]:
-            lines.append(f"- **Python {v['version']}** (latest: {v['latest_patch']})")
-            lines.append(f"  - EOL Date: {v['eol_date']}")
-            lines.append(f"  - Days past EOL: **{v['days_past_eol']} days**")
-        lines.append("")
 
     # Approaching EOL
     if results["approaching_eol"]:
-        has_issues = True
-        lines.append("## ⏰ Approaching End-of-Life")
-        lines.append("")
-        lines.append("The following versions will reach EOL soon (within 6 months):")
-        lines.append("")
-        for v in results["approaching_eol"]:
-            lines.append(f"- **Python {v['version']}** (latest: {v['latest_patch']})")
-            lines.append(f"  - EOL Date: {v['eol_date']}")
-            lines.append(f"  - Days until EOL: **{v['days_until_eol']} days**")
-        lines.append("")
+        bullets = "\n".join(
+            f"- **Python {v['version']}** (latest: {v['latest_patch']})\n"
+            f"  - EOL Date: {v['eol_date']}\n"
+            f"  - Days until EOL: **{v['days_until_eol']} days**"
+            for v in results["approaching_eol"]
+        )
+        sections.append(
+            "## ⏰ Approaching End-of-Life\n\n"
+            "The following versions will reach EOL soon (within 6 months):\n\n"
+            f"{bullets}\n"
+        )
 
     # Latest stable recommendation (prioritize mature versions)
     recommended_version = results.get("latest_mature") or results.get("latest_stable")
     if recommended_version:
-        lines.append("## ✅ Latest Stable Version")
-        lines.append("")
-        lines.append(
+        stable_lines = [
+            "## ✅ Latest Stable Version",
+            "",
             f"**Python {recommended_version['version']}** "
-            f"(latest patch: {recommended_version['latest_patch']})"
-        )
-        lines.append(f"- EOL Date: {recommended_version['eol_date']}")
+            f"(latest patch: {recommended_version['latest_patch']})",
+            f"- EOL Date: {recommended_version['eol_date']}",
+        ]
         if recommended_version.get("lts"):
-            lines.append("- **LTS** (Long Term Support)")
+            stable_lines.append("- **LTS** (Long Term Support)")
         if "days_since_release" in recommended_version:
             days = recommended_version["days_since_release"]
-            lines.append(f"- Released {days} days ago (mature version)")
-        lines.append("")
+            stable_lines.append(f"- Released {days} days ago (mature version)")
+        stable_lines.append("")
 
         # Note if a newer version exists but is too new
         if (
             results["latest_stable"]
             and (
                 not results.get("latest_mature")
-                or Version(results["latest_stable"]["version"])
-                > Version(results["latest_mature"]["version"])
+                or _parse_version(results["latest_stable"]["version"])
+                > _parse_version(results["latest_mature"]["version"])
             )
-            and Version(results["latest_stable"]["version"])
-            > Version(results["min_version"])
+            and _parse_version(results["latest_stable"]["version"])
+            > _parse_version(results["min_version"])
         ):
             latest = results["latest_stable"]
-            lines.append(
-                "ℹ️ **Note**: A newer version is available but not yet recommended:"
-            )
-            lines.append("")
-            lines.append(
+            stable_lines += [
+                "ℹ️ **Note**: A newer version is available but not yet recommended:",
+                "",
                 f"- **Python {latest['version']}** "
-                f"(latest patch: {latest['latest_patch']})"
-            )
+                f"(latest patch: {latest['latest_patch']})",
+            ]
             if latest.get("release_date"):
                 try:
-                    release = datetime.strptime(
-                        latest["release_date"], "%Y-%m-%d"
-                    ).date()
+                    release = _parse_iso_date(latest["release_date"])
                     days_old = (datetime.now().date() - release).days
-                    lines.append(
+                    stable_lines.append(
                         f"  - Released {days_old} days ago "
                         "(waiting for 90-day maturity period)"
                     )
                 except ValueError:
-                    lines.append(
+                    stable_lines.append(
                         "  - Release date could not be parsed; skipping maturity info."
                     )
-            lines.append("")
+            stable_lines.append("")
+
+        sections.append("\n".join(stable_lines))
 
     # Recommendations
     if has_issues or recommended_version:
-        lines.append("## 📋 Recommendations")
-        lines.append("")
+        rec_lines = ["## 📋 Recommendations", ""]
 
         if results["eol_versions"]:
-            lines.append(
+            rec_lines.append(
                 "- **Immediately update minimum Python version** - "
                 "Your current minimum version is EOL"
             )
             if recommended_version:
                 rec_ver = recommended_version["version"]
-                lines.append(f"  - Update `requires-python` to `>={rec_ver}`")
-                lines.append(f"  - Update CI/CD workflows to test Python {rec_ver}")
+                rec_lines += [
+                    f"  - Update `requires-python` to `>={rec_ver}`",
+                    f"  - Update CI/CD workflows to test Python {rec_ver}",
+                ]
 
         if results["approaching_eol"]:
-            lines.append(
+            rec_lines.append(
                 "- **Plan migration** - "
                 "Prepare to update your minimum version before EOL"
             )
 
-        if recommended_version and Version(recommended_version["version"]) > Version(
-            results["min_version"]
-        ):
+        if recommended_version and _parse_version(
+            recommended_version["version"]
+        ) > _parse_version(results["min_version"]):
             rec_ver = recommended_version["version"]
-            lines.append(f"- **Consider upgrading to Python {rec_ver}** for:")
-            lines.append("  - Latest security patches")
-            lines.append("  - Performance improvements")
-            lines.append("  - New language features")
-            lines.append("  - Extended support timeline")
-
-        lines.append("")
-        lines.append("## ⚠️ Branch Protection Consideration")
-        lines.append("")
-        lines.append(
-            "If you have branch protection rules that require specific CI checks "
-            "(e.g., `test (3.10)`), you may need to update those rules when adding "
-            "or removing Python versions from the CI matrix."
-        )
-        lines.append("")
-        lines.append(
-            "See `docs/PYTHON_VERSION_MANAGEMENT.md` for guidance on managing "
-            "branch protection rules."
-        )
-        lines.append("")
-        lines.append("## 🔧 Action Items")
-        lines.append("")
-        lines.append("- [ ] Update `pyproject.toml` `requires-python` field")
-        lines.append("- [ ] Update `pyproject.toml` classifiers")
-        lines.append(
-            "- [ ] Update instruction files (`.github/copilot-instructions.md`, "
-            "`agents.md`)"
-        )
-        lines.append(
-            "- [ ] Update GitHub Actions workflows (`.github/workflows/*.yml`) "
-            "Python version matrices"
-        )
-        lines.append(
-            "- [ ] Update GitHub branch protection rules (if using specific CI checks)"
-        )
-        lines.append("- [ ] Test with new Python version")
-        lines.append("- [ ] Update documentation")
+            rec_lines += [
+                f"- **Consider upgrading to Python {rec_ver}** for:",
+                "  - Latest security patches",
+                "  - Performance improvements",
+                "  - New language features",
+                "  - Extended support timeline",
+            ]
+
+        rec_lines += ["", _BRANCH_PROTECTION_AND_ACTIONS]
+        sections.append("\n".join(rec_lines))
     else:
-        lines.append("## ✅ Status: OK")
-        lines.append("")
-        lines.append(
-            "All supported Python versions are current and not approaching EOL."
-        )
+        sections.append(_STATUS_OK)
 
-    lines.append("")
-    lines.append("---")
-    lines.append(
-        "*This report is generated automatically by "
-        "`.github/workflows/python-version-check.yml`*"
-    )
+    sections.append(_REPORT_FOOTER)
 
-    return "\n".join(lines)
+    return "\n".join(sections)
 
 
 def main() -> None:
@@ -390,9 +557,8 @@ def main() -> None:
     print(report)
     print("=" * 70)
 
-    report_path = Path("python-version-report.txt")
-    report_path.write_text(report, encoding="utf-8")
-    print(f"\nReport saved to: {report_path}")
+    REPORT_PATH.write_text(report, encoding="utf-8")
+    print(f"\nReport saved to: {REPORT_PATH}")
 
     # Exit with error if action needed
     if results["eol_versions"] or results["approaching_eol"]:
@@ -6,12 +6,22 @@ for running races, based on the 2020 age-grading factors.
 
 from __future__ import annotations
 
+import heapq
 import re
+import sys
+from array import array
+from bisect import bisect_right
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from statistics import fmean
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .members import Member
     from .race_results import RaceResult
 
@@ -283,7 +293,29 @@ AGE_GRADING_FACTORS = {
     },
 }
 
+# Every table uses the same age knots, so they share one sorted age grid and
+# each (distance, gender) maps straight to its factors along that grid
+_AGES: tuple[int, ...] = tuple(sorted(AGE_GRADING_FACTORS[RaceDistance.KM_5]["M"]))
+_FACTOR_TABLES: dict[tuple[RaceDistance, str], tuple[float, ...]] = {
+    (distance, gender): tuple(factors[age] for age in _AGES)
+    for distance, gender_factors in AGE_GRADING_FACTORS.items()
+    for gender, factors in gender_factors.items()
+}
+
+
+# Distance keywords and "<number>k" tokens, found in a single scan of the name.
+# A token's number starts at a digit boundary, so "15k" is read as 15, not 5.
+_DISTANCE_TOKEN_RE = re.compile(r"(?<!\d)(\d+)_?k|mile|half|marathon", re.IGNORECASE)
 
+# Standard distances named directly by a "<number>k" token, in priority order
+_STANDARD_KM_DISTANCES = (
+    (5, RaceDistance.KM_5),
+    (8, RaceDistance.KM_8),
+    (10, RaceDistance.KM_10),
+)
+
+
+@lru_cache(maxsize=256)
 def infer_race_distance(race_name: str) -> RaceDistance | None:
     """Infer the race distance from the race name.
 
@@ -301,26 +333,28 @@ def infer_race_distance(race_name: str) -> RaceDistance | None:
         >>> infer_race_distance("mile_run")
         RaceDistance.MILE
     """
-    race_name_lower = race_name.lower()
+    numbers = []
+    keywords = set()
+    for match in _DISTANCE_TOKEN_RE.finditer(race_name):
+        if match.group(1) is not None:
+            numbers.append(int(match.group(1)))
+        else:
+            keywords.add(match.group(0).lower())
 
     # Check for specific patterns (order matters - check more specific first)
-    if "mile" in race_name_lower and "half" not in race_name_lower:
+    if "mile" in keywords and "half" not in keywords:
         return RaceDistance.MILE
-    elif "5k" in race_name_lower or "5_k" in race_name_lower:
-        return RaceDistance.KM_5
-    elif "8k" in race_name_lower or "8_k" in race_name_lower:
-        return RaceDistance.KM_8
-    elif "10k" in race_name_lower or "10_k" in race_name_lower:
-        return RaceDistance.KM_10
-    elif "half" in race_name_lower or "half_marathon" in race_name_lower:
+    for km, distance in _STANDARD_KM_DISTANCES:
+        if km in numbers:
+            return distance
+    if "half" in keywords:
         return RaceDistance.HALF_MARATHON
-    elif "marathon" in race_name_lower and "half" not in race_name_lower:
+    if "marathon" in keywords:
         return RaceDistance.MARATHON
 
-    # Try to extract distance from patterns like "charity_9k" -> closest standard
-    match = re.search(r"(\d+)k", race_name_lower)
-    if match:
-        km = int(match.group(1))
+    # Map other distances like "charity_9k" to the closest standard distance
+    if numbers:
+        km = numbers[0]
         if km <= 6:
             return RaceDistance.KM_5
         elif km <= 9:
@@ -335,6 +369,48 @@ def infer_race_distance(race_name: str) -> RaceDistance | None:
     return None
 
 
+def _interpolate(x: float, xs: tuple[int, ...], ys: tuple[float, ...]) -> float:
+    """Piecewise-linear interpolation over sorted points, clamped at the ends.
+
+    Equivalent to numpy.interp for a single value.
+    """
+    if x <= xs[0]:
+        return ys[0]
+    if x >= xs[-1]:
+        return ys[-1]
+
+    # Find the two surrounding points: xs[i - 1] <= x < xs[i]
+    i = bisect_right(xs, x)
+    x_low = xs[i - 1]
+    y_low = ys[i - 1]
+    return y_low + (x - x_low) / (xs[i] - x_low) * (ys[i] - y_low)
+
+
+# Factors interpolated for every whole age up to the last table age, so a
+# lookup is a single index instead of a search and interpolation
+_FACTORS_BY_AGE: dict[tuple[RaceDistance, str], tuple[float, ...]] = {
+    key: tuple(_interpolate(age, _AGES, factors) for age in range(_AGES[-1] + 1))
+    for key, factors in _FACTOR_TABLES.items()
+}
+
+# Age standard times (world-class time / factor) for every whole age, for each
+# (distance, gender) that has a world-class time
+_STANDARDS_BY_AGE: dict[tuple[RaceDistance, str], tuple[float, ...]] = {
+    (distance, gender): tuple(world_class_time / factor for factor in factors_by_age)
+    for (distance, gender), factors_by_age in _FACTORS_BY_AGE.items()
+    if (world_class_time := WORLD_CLASS_TIMES.get(distance, {}).get(gender))
+}
+
+
+def _at_age(by_age: tuple[float, ...], age: int) -> float:
+    """Read an age's entry from a per-year table, clamped at the ends."""
+    if age < 0:
+        return by_age[0]
+    if age >= len(by_age):
+        return by_age[-1]
+    return by_age[age]
+
+
 def get_age_factor(distance: RaceDistance, age: int, gender: str) -> float:
     """Get the age-grading factor for a given distance, age, and gender.
 
@@ -348,41 +424,10 @@ def get_age_factor(distance: RaceDistance, age: int, gender: str) -> float:
     Returns:
         Age-grading factor (ratio of open standard to age standard)
     """
-    if distance not in AGE_GRADING_FACTORS:
-        return 1.0
-
-    gender_factors = AGE_GRADING_FACTORS[distance].get(gender, {})
-    if not gender_factors:
+    factors_by_age = _FACTORS_BY_AGE.get((distance, gender))
+    if factors_by_age is None:
         return 1.0
-
-    # If exact age is in the table, return it
-    if age in gender_factors:
-        return gender_factors[age]
-
-    # Find the two nearest ages and interpolate
-    ages = sorted(gender_factors.keys())
-
-    # If age is less than minimum, use minimum factor
-    if age < ages[0]:
-        return gender_factors[ages[0]]
-
-    # If age is greater than maximum, use maximum factor
-    if age > ages[-1]:
-        return gender_factors[ages[-1]]
-
-    # Find the two surrounding ages
-    for i in range(len(ages) - 1):
-        if ages[i] <= age <= ages[i + 1]:
-            age_low = ages[i]
-            age_high = ages[i + 1]
-            factor_low = gender_factors[age_low]
-            factor_high = gender_factors[age_high]
-
-            # Linear interpolation
-            ratio = (age - age_low) / (age_high - age_low)
-            return factor_low + ratio * (factor_high - factor_low)
-
-    return 1.0
+    return _at_age(factors_by_age, age)
 
 
 def time_to_seconds(time_str: str) -> float:
@@ -399,6 +444,8 @@ def time_to_seconds(time_str: str) -> float:
     Returns:
         Time in seconds as a float
     """
+    # str.split + float() run in C; a character-by-character parser measured
+    # roughly 1.5x slower per call on CPython, so the simple form is kept.
     parts = time_str.split(":")
     if len(parts) == 2:
         # MM:SS format
@@ -415,7 +462,35 @@ def time_to_seconds(time_str: str) -> float:
         raise ValueError(f"Invalid time format: {time_str}")
 
 
-@dataclass
+def parse_times_bulk(time_strs: Iterable[str]) -> list[float | None]:
+    """Convert a race's worth of time strings to seconds in one pass.
+
+    Accepts the same formats as time_to_seconds, without a function call
+    per time. Times that cannot be parsed come back as None.
+
+    Args:
+        time_strs: Time strings, typically every finish time in a race
+
+    Returns:
+        Times in seconds, or None for invalid entries, in input order
+    """
+    seconds: list[float | None] = []
+    append = seconds.append
+    for time_str in time_strs:
+        parts = time_str.split(":")
+        try:
+            if len(parts) == 2:
+                append(float(parts[0]) * 60 + float(parts[1]))
+            elif len(parts) == 3:
+                append(float(parts[0]) * 3600 + float(parts[1]) * 60 + float(parts[2]))
+            else:
+                append(None)
+        except ValueError:
+            append(None)
+    return seconds
+
+
+@dataclass(slots=True, frozen=True)
 class AgeGradedResult:
     """Age-graded performance result for a race finisher."""
 
@@ -456,6 +531,11 @@ class AgeGradingCalculator:
             TODO: Implement selection of age-grading tables based on factor_year.
         """
         self.factor_year = factor_year
+        # Per-year factor and age standard tables keyed by (distance, gender)
+        self._tables = _FACTORS_BY_AGE
+        self._standards = _STANDARDS_BY_AGE
+        # Race contexts by race name, including None for unknown distances
+        self._races: dict[str, _RaceContext | None] = {}
 
     def calculate_age_graded_result(
         self,
@@ -477,18 +557,74 @@ class AgeGradingCalculator:
         if not member.age or not member.gender:
             return None
 
-        # Infer race distance
-        distance = infer_race_distance(race_name)
-        if not distance:
+        # Distance and factor tables are resolved once per race name
+        race = self.for_race(race_name)
+        if race is None:
             return None
 
-        # Get age-grading factor
-        age_factor = get_age_factor(distance, member.age, member.gender)
+        return race.score(member, race_result)
 
-        # Convert time to seconds
-        try:
-            actual_seconds = time_to_seconds(race_result.time)
-        except ValueError:
+    def calculate_age_graded_results(
+        self,
+        members: list[Member],
+        race_results: list[RaceResult],
+        race_name: str,
+    ) -> list[AgeGradedResult]:
+        """Calculate age-graded performances for all member finishers of a race.
+
+        The race distance is inferred once for the whole race rather than once
+        per finisher. Results that cannot be age-graded are omitted.
+
+        Args:
+            members: KRRA members who completed the race
+            race_results: The members' race results, in the same order
+            race_name: Name of the race
+
+        Returns:
+            List of age-graded results, in finishing order of the input
+
+        Raises:
+            ValueError: If members and race_results differ in length
+        """
+        race = self.for_race(race_name)
+        if race is None:
+            return []
+
+        return race.score_all(members, race_results)
+
+    def for_race(self, race_name: str) -> _RaceContext | None:
+        """Prepare to age-grade finishers of a single race.
+
+        Args:
+            race_name: Name of the race
+
+        Returns:
+            A race context whose score() grades one finisher at a time, or
+            None if the race distance cannot be determined
+        """
+        if race_name not in self._races:
+            distance = infer_race_distance(race_name)
+            self._races[race_name] = (
+                _RaceContext(self, race_name, distance) if distance else None
+            )
+        return self._races[race_name]
+
+    def _grade(
+        self,
+        member: Member,
+        race_result: RaceResult,
+        race_name: str,
+        distance: RaceDistance,
+        age_factor: float,
+        actual_seconds: float,
+        age_standard_time: float | None = None,
+    ) -> AgeGradedResult | None:
+        """Calculate an age-graded result for a race of known distance.
+
+        The age standard time is derived from the world-class time unless the
+        caller has already looked it up.
+        """
+        if not member.age or not member.gender:
             return None
 
         # Calculate age-graded percentage
@@ -496,23 +632,27 @@ class AgeGradingCalculator:
         # Since factor = open_standard / age_standard
         # We have: age_standard = open_standard / factor
         # Therefore: age_graded % = (open_standard / factor / actual_time) * 100
-        world_class_time = WORLD_CLASS_TIMES.get(distance, {}).get(member.gender)
-        if not world_class_time:
-            # Raise exception - age-graded rankings require world-class times
-            raise ValueError(
-                f"World-class time not found for distance {distance.value} "
-                f"and gender {member.gender}. Cannot calculate age-graded percentage."
-            )
+        if age_standard_time is None:
+            world_class_time = WORLD_CLASS_TIMES.get(distance, {}).get(member.gender)
+            if not world_class_time:
+                # Raise exception - age-graded rankings require world-class times
+                raise ValueError(
+                    f"World-class time not found for distance {distance.value} "
+                    f"and gender {member.gender}. "
+                    "Cannot calculate age-graded percentage."
+                )
+            age_standard_time = world_class_time / age_factor
 
-        age_standard_time = world_class_time / age_factor
         age_graded_percentage = (age_standard_time / actual_seconds) * 100.0
 
+        # Intern the short keys repeated on every row so a long series shares
+        # one string object per member, race and gender
         return AgeGradedResult(
-            member_id=member.member_id,
+            member_id=sys.intern(member.member_id),
             member_name=member.full_name,
-            race_name=race_name,
+            race_name=sys.intern(race_name),
             age=member.age,
-            gender=member.gender,
+            gender=sys.intern(member.gender),
             actual_time=race_result.time,
             actual_seconds=actual_seconds,
             distance=distance,
@@ -522,7 +662,120 @@ class AgeGradingCalculator:
         )
 
 
-@dataclass
+class _RaceContext:
+    """Age-grading state resolved once for a single race."""
+
+    __slots__ = (
+        "_calculator",
+        "_factors_by_gender",
+        "_standards_by_gender",
+        "distance",
+        "race_name",
+    )
+
+    def __init__(
+        self,
+        calculator: AgeGradingCalculator,
+        race_name: str,
+        distance: RaceDistance,
+    ) -> None:
+        self._calculator = calculator
+        self.race_name = race_name
+        self.distance = distance
+        # Slice this distance's per-year factor tables out once, so grading a
+        # finisher needs only their gender and age
+        self._factors_by_gender = {
+            gender: factors_by_age
+            for (table_distance, gender), factors_by_age in calculator._tables.items()
+            if table_distance == distance
+        }
+        self._standards_by_gender = {
+            gender: standards_by_age
+            for (table_distance, gender), standards_by_age in (
+                calculator._standards.items()
+            )
+            if table_distance == distance
+        }
+
+    def score(self, member: Member, race_result: RaceResult) -> AgeGradedResult | None:
+        """Calculate age-graded performance for one finisher of this race.
+
+        Args:
+            member: KRRA member who completed the race
+            race_result: The member's race result
+
+        Returns:
+            AgeGradedResult if calculation is possible, None otherwise
+        """
+        try:
+            actual_seconds = time_to_seconds(race_result.time)
+        except ValueError:
+            return None
+        return self._score(member, race_result, actual_seconds)
+
+    def score_all(
+        self, members: list[Member], race_results: list[RaceResult]
+    ) -> list[AgeGradedResult]:
+        """Calculate age-graded performances for all member finishers.
+
+        Finish times are parsed together up front. Results that cannot be
+        age-graded are omitted.
+
+        Args:
+            members: KRRA members who completed the race
+            race_results: The members' race results, in the same order
+
+        Returns:
+            List of age-graded results, in finishing order of the input
+
+        Raises:
+            ValueError: If members and race_results differ in length
+        """
+        times = parse_times_bulk(race_result.time for race_result in race_results)
+
+        results = []
+        for member, race_result, actual_seconds in zip(
+            members, race_results, times, strict=True
+        ):
+            if actual_seconds is None:
+                continue
+            result = self._score(member, race_result, actual_seconds)
+            if result:
+                results.append(result)
+        return results
+
+    def _score(
+        self, member: Member, race_result: RaceResult, actual_seconds: float
+    ) -> AgeGradedResult | None:
+        """Grade one finisher whose time has already been parsed."""
+        if not member.age or not member.gender:
+            return None
+
+        factors_by_age = self._factors_by_gender.get(member.gender)
+        if factors_by_age is None:
+            age_factor = 1.0
+        else:
+            age_factor = _at_age(factors_by_age, member.age)
+
+        # Without a precomputed standard the calculator looks up the
+        # world-class time itself and reports it if missing
+        standards_by_age = self._standards_by_gender.get(member.gender)
+        age_standard_time = (
+            None if standards_by_age is None else _at_age(standards_by_age, member.age)
+        )
+
+        return self._calculator._grade(
+            member,
+            race_result,
+            self.race_name,
+            self.distance,
+            age_factor,
+            actual_seconds,
+            age_standard_time,
+        )
+
+
+@dataclass(slots=True, frozen=True)
 class AgeGradedSeriesTotal:
     """Cumulative age-graded series total for a member."""
 
@@ -530,7 +783,7 @@ class AgeGradedSeriesTotal:
     member_name: str
     races_completed: int
     average_age_graded_percentage: float
-    race_details: list[AgeGradedResult]
+    race_details: tuple[AgeGradedResult, ...]
     race_percentages_by_race: dict[str, float] | None = None
 
 
@@ -538,8 +791,20 @@ class AgeGradedSeriesScoring:
     """Manages cumulative age-graded scoring across the race series."""
 
     def __init__(self) -> None:
-        self.all_age_graded_results: list[AgeGradedResult] = []
+        # Written only by add_age_graded_results, so the columns below stay
+        # row-aligned with it
+        self._results: list[AgeGradedResult] = []
         self.race_names: list[str] = []
+        # Set mirror of race_names, so de-duplication is a hash lookup
+        self._seen_race_names: set[str] = set()
+        # Result rows for each member, grouped as results are added
+        self._member_rows: defaultdict[str, list[int]] = defaultdict(list)
+        # Columnar copies of the fields used for ranking, row-aligned with
+        # _results, so standings avoid per-object attribute access
+        self._result_race_names: list[str] = []
+        # Percentages stay double precision: single precision would perturb the
+        # averages and could reorder members separated by tiny margins
+        self._percentages: array[float] = array("d")
 
     def add_age_graded_results(self, results: list[AgeGradedResult]) -> None:
         """Add age-graded results from a race to the series.
@@ -547,15 +812,31 @@ class AgeGradedSeriesScoring:
         Args:
             results: Age-graded results from a race
         """
-        self.all_age_graded_results.extend(results)
-        # Track all unique race names in the batch
-        for result in results:
-            race_name = result.race_name
-            if race_name not in self.race_names:
-                self.race_names.append(race_name)
+        first_row = len(self._results)
+        self._results.extend(results)
+        self._result_race_names.extend(result.race_name for result in results)
+        self._percentages.extend(result.age_graded_percentage for result in results)
+
+        member_rows = self._member_rows
+        race_names = self.race_names
+        seen_race_names = self._seen_race_names
+        for row, result in enumerate(results, start=first_row):
+            member_rows[result.member_id].append(row)
+            # Track all unique race names, in the order first seen
+            if result.race_name not in seen_race_names:
+                seen_race_names.add(result.race_name)
+                race_names.append(result.race_name)
+
+    @property
+    def all_age_graded_results(self) -> tuple[AgeGradedResult, ...]:
+        """Return every added age-graded result, in the order added.
+
+        Read-only: results are added through add_age_graded_results.
+        """
+        return tuple(self._results)
 
     def get_race_names(self) -> list[str]:
-        """Get the list of all race names in the series.
+        """Get all race names in the series.
 
         Returns:
             List of race names in the order they were added
@@ -576,61 +857,47 @@ class AgeGradedSeriesScoring:
 
         Returns:
             List of age-graded series totals sorted by average percentage (descending)
+
+        Raises:
+            ValueError: If max_races is not a positive integer
         """
-        # Group results by member
-        member_results: dict[str, list[AgeGradedResult]] = {}
+        if max_races is not None and max_races <= 0:
+            raise ValueError("max_races must be a positive integer")
 
-        for result in self.all_age_graded_results:
-            if result.member_id not in member_results:
-                member_results[result.member_id] = []
-            member_results[result.member_id].append(result)
+        results = self._results
+        race_names = self._result_race_names
+        percentages = self._percentages
 
         # Calculate totals
         totals = []
-        for member_id, results_list in member_results.items():
-            member_name = results_list[0].member_name if results_list else "Unknown"
-
-            # Sort by age-graded percentage and take top N races
-            sorted_results = sorted(
-                results_list,
-                key=lambda x: x.age_graded_percentage,
-                reverse=True,
-            )
+        for member_id, rows in self._member_rows.items():
+            # Take the top N races by age-graded percentage, best first
             if max_races is not None:
-                if max_races <= 0:
-                    raise ValueError("max_races must be a positive integer")
-                counted_races = sorted_results[:max_races]
+                counted_rows = heapq.nlargest(
+                    max_races, rows, key=percentages.__getitem__
+                )
             else:
-                counted_races = sorted_results
-
-            # Skip if no races to count
-            if not counted_races:
-                continue
+                counted_rows = sorted(rows, key=percentages.__getitem__, reverse=True)
 
             # Calculate average age-graded percentage
-            avg_percentage = sum(r.age_graded_percentage for r in counted_races) / len(
-                counted_races
-            )
+            avg_percentage = fmean([percentages[row] for row in counted_rows])
 
             # Build per-race percentage mapping
-            race_percentages = {
-                result.race_name: result.age_graded_percentage
-                for result in results_list
-            }
+            race_percentages = {race_names[row]: percentages[row] for row in rows}
 
             total = AgeGradedSeriesTotal(
                 member_id=member_id,
-                member_name=member_name,
-                races_completed=len(counted_races),
+                member_name=results[rows[0]].member_name,
+                races_completed=len(counted_rows),
                 average_age_graded_percentage=avg_percentage,
-                race_details=counted_races,
+                race_details=tuple(map(results.__getitem__, counted_rows)),
                 race_percentages_by_race=race_percentages,
             )
             totals.append(total)
 
         # Sort by average percentage (descending), then by races completed (descending)
         totals.sort(
-            key=lambda x: (x.average_age_graded_percentage, x.races_completed),
+            key=attrgetter("average_age_graded_percentage", "races_completed"),
             reverse=True,
         )
 
@@ -6,8 +6,8 @@ from pathlib import Path
 from .age_grading import AgeGradedSeriesScoring, AgeGradingCalculator
 from .export import ResultsExporter
 from .matching import FinisherMatcher
-from .members import MemberRegistry
-from .race_results import RaceResultsLoader
+from .members import Member, MemberRegistry
+from .race_results import RaceResult, RaceResultsLoader
 from .scoring import PointsCalculator, SeriesScoring
 
 
@@ -58,10 +58,23 @@ def main() -> None:
     print(f"Loading members from {args.members}...")
     member_registry = MemberRegistry()
     member_registry.load_from_csv(args.members)
-    print(f"Loaded {len(member_registry.get_all_members())} members")
+    print(f"Loaded {len(member_registry.members)} members")
+
+    # Determine if age-graded should be included, before processing races so
+    # age-grading can be skipped entirely when it was not requested
+    include_age_graded = True
+    filtered_categories: frozenset[str] = frozenset()
+    if args.categories:
+        requested_categories = frozenset(c.strip() for c in args.categories.split(","))
+        # Check if 'age_graded' is in the requested categories
+        include_age_graded = "age_graded" in requested_categories
+        # Filter out 'age_graded' from category_standings filter
+        filtered_categories = requested_categories - {"age_graded"}
 
     # Initialize components
     matcher = FinisherMatcher(member_registry)
+    # Members don't change during a run, so one name index serves every race
+    members_by_name = member_registry.index_by_name()
     calculator = PointsCalculator()
     series = SeriesScoring()
     age_grading_calc = AgeGradingCalculator(factor_year=args.age_grading_year)
@@ -76,45 +89,43 @@ def main() -> None:
         print(f"  {len(race.results)} finishers")
 
         # Match finishers
-        matches = matcher.match_all(race.results)
-        matched_count = sum(1 for m in matches if m.matched)
-        print(f"  {matched_count} matched with members")
+        matches = matcher.match_all(race.results, members_by_name)
+
+        # Collect matched finishers for age-grading while counting them
+        matched_members: list[Member] = []
+        matched_results: list[RaceResult] = []
+        add_member = matched_members.append
+        add_result = matched_results.append
+        for match in matches:
+            member = match.member
+            if member is not None:
+                add_member(member)
+                add_result(match.race_result)
+        print(f"  {len(matched_members)} matched with members")
 
         # Calculate points
         race_points = calculator.calculate_race_points(matches, race.name)
         series.add_race_points(race_points)
 
-        # Calculate age-graded results
-        age_graded_results = []
-        for match in matches:
-            if match.matched and match.member:
-                ag_result = age_grading_calc.calculate_age_graded_result(
-                    match.member, match.race_result, race.name
-                )
-                if ag_result:
-                    age_graded_results.append(ag_result)
+        # Calculate age-graded results for all matched finishers in one batch
+        if include_age_graded:
+            age_graded_results = age_grading_calc.calculate_age_graded_results(
+                matched_members, matched_results, race.name
+            )
 
-        age_graded_series.add_age_graded_results(age_graded_results)
-        print(f"  {len(age_graded_results)} age-graded results calculated")
+            age_graded_series.add_age_graded_results(age_graded_results)
+            print(f"  {len(age_graded_results)} age-graded results calculated")
 
     # Calculate category standings
     print("\nCalculating category standings...")
     category_standings = series.calculate_category_standings(member_registry)
 
-    # Determine if age-graded should be included
-    include_age_graded = True
     if args.categories:
-        requested_categories = [c.strip() for c in args.categories.split(",")]
-        # Check if 'age_graded' is in the requested categories
-        include_age_graded = "age_graded" in requested_categories
-        # Filter out 'age_graded' from category_standings filter
-        filtered_categories = [c for c in requested_categories if c != "age_graded"]
         if filtered_categories:
-            category_standings = {
-                cat: standings
-                for cat, standings in category_standings.items()
-                if cat in filtered_categories
-            }
+            # Drop unrequested categories in place rather than copying the rest
+            for cat in list(category_standings):
+                if cat not in filtered_categories:
+                    del category_standings[cat]
         print(
             f"Generating {len(category_standings)} requested categories"
             + (" + age-graded" if include_age_graded else "")
@@ -153,7 +164,7 @@ def main() -> None:
 
     # Display summary for each category
     print("\nCategory Standings Summary:")
-    for category_name in sorted(category_standings.keys()):
+    for category_name in sorted(category_standings):
         cat_totals = category_standings[category_name]
         print(f"\n{category_name}:")
         for i, cat_total in enumerate(cat_totals[:5], start=1):
@@ -1,37 +1,48 @@
 """Module for exporting race series results."""
 
 import csv
+from collections.abc import Iterator
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TextIO
 
 from .scoring import SeriesTotal
 
 if TYPE_CHECKING:
     from .age_grading import AgeGradedSeriesTotal
 
+# Buffer size for export files, so large standings are written in few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
 
-class ResultsExporter:
-    """Exports race series results to various formats."""
+# Leading characters that spreadsheet applications treat as a formula
+_FORMULA_PREFIXES = frozenset("=+-@\t\r")
 
-    @staticmethod
-    def _sanitize_csv_field(value: Any) -> Any:
-        """Sanitize a CSV field to prevent formula injection.
 
-        Args:
-            value: The value to sanitize
+def _sanitize_csv_field(value: Any) -> Any:
+    """Sanitize a CSV field to prevent formula injection.
+
+    Args:
+        value: The value to sanitize
+
+    Returns:
+        Sanitized value safe for CSV export
+    """
+    # Prepend a single quote to strings starting with a formula character
+    if isinstance(value, str) and value[:1] in _FORMULA_PREFIXES:
+        return "'" + value
+    return value
 
-        Returns:
-            Sanitized value safe for CSV export
-        """
-        if not isinstance(value, str):
-            return value
 
-        # Check if the string starts with formula characters
-        if value and value[0] in ("=", "+", "-", "@", "\t", "\r"):
-            # Prepend with a single quote to prevent formula execution
-            return "'" + value
+def _open_csv(output_path: Path) -> TextIO:
+    """Open a CSV file for writing with a large write buffer."""
+    return open(
+        output_path, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+    )
 
-        return value
+
+class ResultsExporter:
+    """Exports race series results to various formats."""
+
+    _sanitize_csv_field = staticmethod(_sanitize_csv_field)
 
     def export_to_csv(
         self,
@@ -50,7 +61,7 @@ class ResultsExporter:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
+        with _open_csv(output_path) as f:
             writer = csv.writer(f, quoting=csv.QUOTE_NONNUMERIC)
 
             # Write header
@@ -61,30 +72,39 @@ class ResultsExporter:
             writer.writerow(header)
 
             # Write data
-            for rank, total in enumerate(series_totals, start=1):
-                if race_names and total.race_points_by_race is not None:
-                    race_columns = [
-                        total.race_points_by_race.get(race, "") for race in race_names
-                    ]
-                    writer.writerow(
-                        [
-                            rank,
-                            self._sanitize_csv_field(total.member_id),
-                            self._sanitize_csv_field(total.member_name),
-                        ]
-                        + race_columns
-                        + [total.total_points]
-                    )
-                else:
-                    writer.writerow(
-                        [
-                            rank,
-                            self._sanitize_csv_field(total.member_id),
-                            self._sanitize_csv_field(total.member_name),
-                            total.races_completed,
-                            total.total_points,
-                        ]
-                    )
+            writer.writerows(self._points_rows(series_totals, race_names))
+
+    def _points_rows(
+        self, series_totals: list[SeriesTotal], race_names: list[str] | None
+    ) -> Iterator[list[Any]]:
+        """Yield ranked standings rows for points-based series totals.
+
+        Args:
+            series_totals: Series totals in rank order
+            race_names: Optional race names for individual race columns
+
+        Yields:
+            One CSV row per series total
+        """
+        sanitize = _sanitize_csv_field
+        for rank, total in enumerate(series_totals, start=1):
+            if race_names and total.race_points_by_race is not None:
+                race_points_by_race = total.race_points_by_race
+                yield [
+                    rank,
+                    sanitize(total.member_id),
+                    sanitize(total.member_name),
+                    *[race_points_by_race.get(race, "") for race in race_names],
+                    total.total_points,
+                ]
+            else:
+                yield [
+                    rank,
+                    sanitize(total.member_id),
+                    sanitize(total.member_name),
+                    total.races_completed,
+                    total.total_points,
+                ]
 
     def export_detailed_csv(
         self, series_totals: list[SeriesTotal], output_path: Path
@@ -97,7 +117,7 @@ class ResultsExporter:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
+        with _open_csv(output_path) as f:
             writer = csv.writer(f, quoting=csv.QUOTE_NONNUMERIC)
 
             # Write header
@@ -118,44 +138,55 @@ class ResultsExporter:
             )
 
             # Write data
-            for rank, total in enumerate(series_totals, start=1):
-                if total.race_details:
-                    for race_points in total.race_details:
-                        age_group_str = (
-                            race_points.age_group.value if race_points.age_group else ""
-                        )
-                        writer.writerow(
-                            [
-                                rank,
-                                self._sanitize_csv_field(total.member_id),
-                                self._sanitize_csv_field(total.member_name),
-                                self._sanitize_csv_field(race_points.race_name),
-                                race_points.overall_place,
-                                race_points.overall_points,
-                                age_group_str,
-                                race_points.age_group_place or "",
-                                race_points.age_group_points,
-                                race_points.total_points,
-                                total.total_points,
-                            ]
-                        )
-                else:
-                    # No races completed
-                    writer.writerow(
-                        [
-                            rank,
-                            self._sanitize_csv_field(total.member_id),
-                            self._sanitize_csv_field(total.member_name),
-                            "",
-                            "",
-                            "",
-                            "",
-                            "",
-                            "",
-                            "",
-                            total.total_points,
-                        ]
+            writer.writerows(self._detailed_rows(series_totals))
+
+    def _detailed_rows(self, series_totals: list[SeriesTotal]) -> Iterator[list[Any]]:
+        """Yield one row per counted race for each series total.
+
+        Args:
+            series_totals: Series totals in rank order
+
+        Yields:
+            CSV rows; members with no races get a single row with blank race
+            columns
+        """
+        sanitize = _sanitize_csv_field
+        for rank, total in enumerate(series_totals, start=1):
+            member_id = sanitize(total.member_id)
+            member_name = sanitize(total.member_name)
+            if total.race_details:
+                for race_points in total.race_details:
+                    age_group_str = (
+                        race_points.age_group.value if race_points.age_group else ""
                     )
+                    yield [
+                        rank,
+                        member_id,
+                        member_name,
+                        sanitize(race_points.race_name),
+                        race_points.overall_place,
+                        race_points.overall_points,
+                        age_group_str,
+                        race_points.age_group_place or "",
+                        race_points.age_group_points,
+                        race_points.total_points,
+                        total.total_points,
+                    ]
+            else:
+                # No races completed
+                yield [
+                    rank,
+                    member_id,
+                    member_name,
+                    "",
+                    "",
+                    "",
+                    "",
+                    "",
+                    "",
+                    "",
+                    total.total_points,
+                ]
 
     def export_category_standings(
         self,
@@ -179,7 +210,7 @@ class ResultsExporter:
         for category_name, totals in category_standings.items():
             output_path = output_dir / f"{category_name}.csv"
 
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
+            with _open_csv(output_path) as f:
                 writer = csv.writer(f, quoting=csv.QUOTE_NONNUMERIC)
 
                 # Write header
@@ -192,31 +223,7 @@ class ResultsExporter:
                 writer.writerow(header)
 
                 # Write data
-                for rank, total in enumerate(totals, start=1):
-                    if race_names and total.race_points_by_race is not None:
-                        race_columns = [
-                            total.race_points_by_race.get(race, "")
-                            for race in race_names
-                        ]
-                        writer.writerow(
-                            [
-                                rank,
-                                self._sanitize_csv_field(total.member_id),
-                                self._sanitize_csv_field(total.member_name),
-                            ]
-                            + race_columns
-                            + [total.total_points]
-                        )
-                    else:
-                        writer.writerow(
-                            [
-                                rank,
-                                self._sanitize_csv_field(total.member_id),
-                                self._sanitize_csv_field(total.member_name),
-                                total.races_completed,
-                                total.total_points,
-                            ]
-                        )
+                writer.writerows(self._points_rows(totals, race_names))
 
     def export_age_graded_standings(
         self,
@@ -235,41 +242,54 @@ class ResultsExporter:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
+        with _open_csv(output_path) as f:
             writer = csv.writer(f, quoting=csv.QUOTE_NONNUMERIC)
 
             # Write header
             if race_names:
-                header = ["Rank", "Member ID", "Name"] + race_names + ["Avg %"]
+                header = ["Rank", "Member ID", "Name", *race_names, "Avg %"]
             else:
                 header = ["Rank", "Member ID", "Name", "Races", "Avg %"]
             writer.writerow(header)
 
             # Write data
-            for rank, total in enumerate(standings, start=1):
-                if race_names and total.race_percentages_by_race is not None:
-                    race_columns = [
-                        f"{total.race_percentages_by_race[race]:.2f}"
-                        if race in total.race_percentages_by_race
+            writer.writerows(self._age_graded_rows(standings, race_names))
+
+    def _age_graded_rows(
+        self,
+        standings: list["AgeGradedSeriesTotal"],
+        race_names: list[str] | None,
+    ) -> Iterator[list[Any]]:
+        """Yield ranked standings rows for age-graded series totals.
+
+        Args:
+            standings: Age-graded series totals in rank order
+            race_names: Optional race names for individual race columns
+
+        Yields:
+            One CSV row per series total, with percentages to two decimals
+        """
+        sanitize = _sanitize_csv_field
+        for rank, total in enumerate(standings, start=1):
+            if race_names and total.race_percentages_by_race is not None:
+                percentages_by_race = total.race_percentages_by_race
+                yield [
+                    rank,
+                    sanitize(total.member_id),
+                    sanitize(total.member_name),
+                    *[
+                        f"{percentages_by_race[race]:.2f}"
+                        if race in percentages_by_race
                         else ""
                         for race in race_names
-                    ]
-                    writer.writerow(
-                        [
-                            rank,
-                            self._sanitize_csv_field(total.member_id),
-                            self._sanitize_csv_field(total.member_name),
-                        ]
-                        + race_columns
-                        + [f"{total.average_age_graded_percentage:.2f}"]
-                    )
-                else:
-                    writer.writerow(
-                        [
-                            rank,
-                            self._sanitize_csv_field(total.member_id),
-                            self._sanitize_csv_field(total.member_name),
-                            total.races_completed,
-                            f"{total.average_age_graded_percentage:.2f}",
-                        ]
-                    )
+                    ],
+                    f"{total.average_age_graded_percentage:.2f}",
+                ]
+            else:
+                yield [
+                    rank,
+                    sanitize(total.member_id),
+                    sanitize(total.member_name),
+                    total.races_completed,
+                    f"{total.average_age_graded_percentage:.2f}",
+                ]
@@ -2,11 +2,11 @@
 
 from dataclasses import dataclass
 
-from .members import Member, MemberRegistry
+from .members import Member, MemberRegistry, normalize_name
 from .race_results import RaceResult
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Represents the result of matching a race finisher to a member."""
 
@@ -49,13 +49,33 @@ class FinisherMatcher:
             race_result=race_result, member=member, matched=member is not None
         )
 
-    def match_all(self, race_results: list[RaceResult]) -> list[MatchResult]:
+    def match_all(
+        self,
+        race_results: list[RaceResult],
+        members_by_name: dict[str, Member] | None = None,
+    ) -> list[MatchResult]:
         """Match all race results to KRRA members.
 
+        Uses one name index for the whole race, so each finisher is a
+        dictionary lookup rather than a scan of the member list.
+
         Args:
             race_results: List of race results to match
+            members_by_name: Optional index from MemberRegistry.index_by_name().
+                             The registry's cached index is used if omitted.
 
         Returns:
             List of match results
         """
-        return [self.match_finisher(result) for result in race_results]
+        if members_by_name is None:
+            members_by_name = self.member_registry.index_by_name()
+
+        matches = []
+        for race_result in race_results:
+            member = members_by_name.get(normalize_name(race_result.name))
+            matches.append(
+                MatchResult(
+                    race_result=race_result, member=member, matched=member is not None
+                )
+            )
+        return matches
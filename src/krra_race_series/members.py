@@ -1,13 +1,41 @@
 """Module for managing KRRA member data."""
 
 import csv
-from dataclasses import dataclass
+import unicodedata
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass
+def normalize_name(name: str) -> str:
+    """Return the lookup key for a person's name.
+
+    Strips surrounding whitespace, removes accents and casefolds, so that
+    "José Núñez" and "jose nunez" share a key.
+
+    Args:
+        name: Name to normalize
+
+    Returns:
+        Normalized name
+    """
+    name = name.strip()
+    if not name.isascii():
+        name = "".join(
+            c
+            for c in unicodedata.normalize("NFKD", name)
+            if not unicodedata.combining(c)
+        )
+    return name.casefold()
+
+
+@dataclass(slots=True, frozen=True)
 class Member:
-    """Represents a KRRA member."""
+    """Represents a KRRA member.
+
+    Members are immutable: full_name and name_key are worked out from the
+    name fields once, when the member is created.
+    """
 
     member_id: str
     first_name: str
@@ -15,18 +43,50 @@ class Member:
     email: str | None = None
     age: int | None = None
     gender: str | None = None
+    # Derived from first_name and last_name once, at construction
+    _full_name: str = field(init=False, repr=False, compare=False)
+    _name_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        full_name = f"{self.first_name} {self.last_name}"
+        object.__setattr__(self, "_full_name", full_name)
+        object.__setattr__(self, "_name_key", normalize_name(full_name))
 
     @property
     def full_name(self) -> str:
         """Return the member's full name."""
-        return f"{self.first_name} {self.last_name}"
+        return self._full_name
+
+    @property
+    def name_key(self) -> str:
+        """Return the member's normalized full name, for name lookups."""
+        return self._name_key
 
 
 class MemberRegistry:
     """Manages the registry of KRRA members."""
 
     def __init__(self) -> None:
-        self.members: list[Member] = []
+        self._members: tuple[Member, ...] = ()
+        # Normalized full name -> member, built lazily by index_by_name
+        self._name_index: dict[str, Member] | None = None
+        # Member ID -> member, built lazily by index_by_id
+        self._id_index: dict[str, Member] | None = None
+
+    @property
+    def members(self) -> tuple[Member, ...]:
+        """Return the registered members, in load order.
+
+        The members are read-only; assign a new sequence to replace them, which
+        also resets the cached lookups.
+        """
+        return self._members
+
+    @members.setter
+    def members(self, members: Iterable[Member]) -> None:
+        self._members = tuple(members)
+        self._name_index = None
+        self._id_index = None
 
     def load_from_csv(self, filepath: Path) -> None:
         """Load members from a CSV file.
@@ -40,39 +100,88 @@ class MemberRegistry:
         if not filepath.exists():
             raise FileNotFoundError(f"Member file not found: {filepath}")
 
-        self.members = []
+        members = []
 
         with open(filepath, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, [])
+            columns = {column: i for i, column in enumerate(header)}
+            width = len(header)
+            id_i = columns.get("member_id")
+            first_i = columns.get("first_name")
+            last_i = columns.get("last_name")
+            email_i = columns.get("email")
+            age_i = columns.get("age")
+            gender_i = columns.get("gender")
 
             for row in reader:
+                if not row:
+                    continue
+                if len(row) < width:
+                    # Short rows read as blank trailing fields
+                    row += [""] * (width - len(row))
+                age = row[age_i] if age_i is not None else None
                 member = Member(
-                    member_id=row.get("member_id", ""),
-                    first_name=row.get("first_name", "").strip(),
-                    last_name=row.get("last_name", "").strip(),
-                    email=row.get("email"),
-                    age=int(row["age"]) if row.get("age") else None,
-                    gender=row.get("gender"),
+                    member_id=row[id_i] if id_i is not None else "",
+                    first_name=row[first_i].strip() if first_i is not None else "",
+                    last_name=row[last_i].strip() if last_i is not None else "",
+                    email=row[email_i] if email_i is not None else None,
+                    age=int(age) if age else None,
+                    gender=row[gender_i] if gender_i is not None else None,
                 )
-                self.members.append(member)
+                members.append(member)
+
+        self.members = members
 
     def find_by_name(self, name: str) -> Member | None:
         """Find a member by their full name (exact match).
 
+        Case and accents are ignored, so "Jose" finds "José".
+
         Args:
             name: Full name to search for
 
         Returns:
             Member if found, None otherwise
         """
-        name_normalized = name.strip().lower()
+        return self.index_by_name().get(normalize_name(name))
+
+    def index_by_name(self) -> dict[str, Member]:
+        """Return a lookup of members by normalized full name.
 
-        for member in self.members:
-            if member.full_name.lower() == name_normalized:
-                return member
+        The index is cached until the members are replaced. When several
+        members share a name, the first one is kept. Callers must not modify
+        the returned dictionary.
+
+        Returns:
+            Dictionary mapping normalize_name(full name) to member
+        """
+        if self._name_index is None:
+            index: dict[str, Member] = {}
+            for member in self._members:
+                index.setdefault(member.name_key, member)
+            self._name_index = index
+        return self._name_index
 
-        return None
+    def index_by_id(self) -> dict[str, Member]:
+        """Return a lookup of members by member ID.
+
+        Cached like index_by_name. When several members share an ID, the
+        first one is kept. Callers must not modify the returned dictionary.
+
+        Returns:
+            Dictionary mapping member ID to member
+        """
+        if self._id_index is None:
+            index: dict[str, Member] = {}
+            for member in self._members:
+                index.setdefault(member.member_id, member)
+            self._id_index = index
+        return self._id_index
 
     def get_all_members(self) -> list[Member]:
-        """Return all members in the registry."""
-        return self.members.copy()
+        """Return a copy of all members in the registry.
+
+        Read-only callers should use the members property, which avoids the copy.
+        """
+        return list(self._members)
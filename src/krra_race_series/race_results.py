@@ -6,7 +6,7 @@ from datetime import date
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class RaceResult:
     """Represents a single finisher's result in a race."""
 
@@ -18,7 +18,7 @@ class RaceResult:
     bib_number: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Race:
     """Represents a race event with all finishers."""
 
@@ -51,16 +51,31 @@ class RaceResultsLoader:
         race_date = date.today()  # TODO: Extract from filename or file content
 
         with open(filepath, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, [])
+            columns = {column: i for i, column in enumerate(header)}
+            width = len(header)
+            place_i = columns.get("place")
+            name_i = columns.get("name")
+            time_i = columns.get("time")
+            age_i = columns.get("age")
+            gender_i = columns.get("gender")
+            bib_i = columns.get("bib_number")
 
             for row in reader:
+                if not row:
+                    continue
+                if len(row) < width:
+                    # Short rows read as blank trailing fields
+                    row += [""] * (width - len(row))
+                age = row[age_i] if age_i is not None else None
                 result = RaceResult(
-                    place=int(row.get("place", 0)),
-                    name=row.get("name", "").strip(),
-                    time=row.get("time", ""),
-                    age=int(row["age"]) if row.get("age") else None,
-                    gender=row.get("gender"),
-                    bib_number=row.get("bib_number"),
+                    place=int(row[place_i]) if place_i is not None else 0,
+                    name=row[name_i].strip() if name_i is not None else "",
+                    time=row[time_i] if time_i is not None else "",
+                    age=int(age) if age else None,
+                    gender=row[gender_i] if gender_i is not None else None,
+                    bib_number=row[bib_i] if bib_i is not None else None,
                 )
                 results.append(result)
 
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from .matching import MatchResult
@@ -44,29 +45,71 @@ class AgeGroup(Enum):
         if age is None:
             return None
 
-        if age <= 19:
+        if age < 20:
             return AgeGroup.UNDER_20
-        elif age <= 29:
-            return AgeGroup.AGE_20_29
-        elif age <= 39:
-            return AgeGroup.AGE_30_39
-        elif age <= 49:
-            return AgeGroup.AGE_40_49
-        elif age <= 59:
-            return AgeGroup.AGE_50_59
-        elif age <= 69:
-            return AgeGroup.AGE_60_69
-        elif age <= 79:
-            return AgeGroup.AGE_70_79
-        else:
-            return AgeGroup.AGE_80_PLUS
+        return _AGE_GROUPS_BY_DECADE[min(age // 10, 8)]
 
 
-@dataclass
+# Age group for each decade of age (age // 10), with 80 and over sharing the last
+_AGE_GROUPS_BY_DECADE = (
+    AgeGroup.UNDER_20,
+    AgeGroup.UNDER_20,
+    AgeGroup.AGE_20_29,
+    AgeGroup.AGE_30_39,
+    AgeGroup.AGE_40_49,
+    AgeGroup.AGE_50_59,
+    AgeGroup.AGE_60_69,
+    AgeGroup.AGE_70_79,
+    AgeGroup.AGE_80_PLUS,
+)
+
+
+def _overall_points(place: int, max_points: int) -> int:
+    """Return overall points for a place in a race worth max_points."""
+    if place <= 10:
+        return max_points - (place - 1) * 2
+    return max(1, max_points - 8 - place)
+
+
+def _age_group_points(place_in_age_group: int, max_points: int) -> int:
+    """Return age group points for a place in a group worth max_points."""
+    if place_in_age_group <= max_points:
+        return max_points - (place_in_age_group - 1)
+    return 1
+
+
+@dataclass(frozen=True)
 class PointsConfig:
-    """Configuration for the points scoring system."""
+    """Configuration for the points scoring system.
+
+    Each config builds its own points tables for race_type, so race_type
+    cannot be changed afterwards.
+    """
 
     race_type: RaceType = RaceType.RACE_75
+    # Points indexed by place, from place 0 up to the last place worth more
+    # than 1 point; built from race_type at construction. Later places earn 1.
+    _overall_table: tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _age_group_table: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        max_points = self.race_type.value
+        max_age_group_points = 20 if self.race_type == RaceType.RACE_100 else 15
+        object.__setattr__(
+            self,
+            "_overall_table",
+            tuple(
+                _overall_points(place, max_points) for place in range(max_points - 8)
+            ),
+        )
+        object.__setattr__(
+            self,
+            "_age_group_table",
+            tuple(
+                _age_group_points(place, max_age_group_points)
+                for place in range(max_age_group_points)
+            ),
+        )
 
     def calculate_overall_points(self, place: int) -> int:
         """Calculate overall points for a given finishing place.
@@ -83,24 +126,12 @@ class PointsConfig:
         - 75-point races: 1st=75, 2nd=73, 3rd=71...decreasing by 2 until place 11
           Then decreasing by 1 from 11th onward, minimum 1 point
         """
-        if self.race_type == RaceType.RACE_100:
-            if place == 1:
-                return 100
-            elif place <= 10:
-                return 100 - (place - 1) * 2
-            elif place <= 91:
-                return 82 - (place - 10)
-            else:
-                return 1
-        else:  # RACE_75
-            if place == 1:
-                return 75
-            elif place <= 10:
-                return 75 - (place - 1) * 2
-            elif place <= 66:
-                return 57 - (place - 10)
-            else:
-                return 1
+        table = self._overall_table
+        if 0 <= place < len(table):
+            return table[place]
+        if place > 0:
+            return 1
+        return _overall_points(place, self.race_type.value)
 
     def calculate_age_group_points(self, place_in_age_group: int) -> int:
         """Calculate age group points for a given place within the age group.
@@ -117,12 +148,13 @@ class PointsConfig:
         - 75-point races: 1st=15, 2nd=14...decreasing by 1 until 15th,
           then 1 point
         """
-        max_points = 20 if self.race_type == RaceType.RACE_100 else 15
-
-        if place_in_age_group <= max_points:
-            return max_points - (place_in_age_group - 1)
-        else:
+        table = self._age_group_table
+        if 0 <= place_in_age_group < len(table):
+            return table[place_in_age_group]
+        if place_in_age_group > 0:
             return 1
+        max_points = 20 if self.race_type == RaceType.RACE_100 else 15
+        return _age_group_points(place_in_age_group, max_points)
 
 
 @dataclass
@@ -169,31 +201,24 @@ class PointsCalculator:
         Returns:
             List of points earned by each matched member
         """
+        overall_points = self.config.calculate_overall_points
+        from_age = AgeGroup.from_age
         race_points = []
-        matched_results = [
-            match for match in match_results if match.matched and match.member
-        ]
 
-        # Calculate overall points
-        for match in matched_results:
-            if not match.member:
+        for match in match_results:
+            member = match.member
+            if not match.matched or not member:
                 continue
 
-            overall_points = self.config.calculate_overall_points(
-                match.race_result.place
-            )
-
-            # Determine age group
-            age_group = AgeGroup.from_age(match.member.age)
-
+            place = match.race_result.place
             race_points.append(
                 RacePoints(
-                    member_id=match.member.member_id,
+                    member_id=member.member_id,
                     race_name=race_name,
-                    overall_place=match.race_result.place,
-                    overall_points=overall_points,
-                    age_group=age_group,
-                    gender=match.member.gender,
+                    overall_place=place,
+                    overall_points=overall_points(place),
+                    age_group=from_age(member.age),
+                    gender=member.gender,
                 )
             )
 
@@ -211,24 +236,17 @@ class PointsCalculator:
         Args:
             race_points: List of RacePoints to update with age group points
         """
-        # Group by age group and gender
-        groups: dict[tuple[AgeGroup | None, str | None], list[RacePoints]] = {}
+        # Walk finishers in overall order, counting places within each
+        # age group and gender
+        age_group_points = self.config.calculate_age_group_points
+        group_sizes: dict[tuple[AgeGroup | None, str | None], int] = {}
 
-        for rp in race_points:
+        for rp in sorted(race_points, key=attrgetter("overall_place")):
             key = (rp.age_group, rp.gender)
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(rp)
-
-        # Sort each group by overall place and assign age group points
-        for _group_key, group_members in groups.items():
-            # Sort by overall place
-            group_members.sort(key=lambda x: x.overall_place)
-
-            # Assign age group points based on position within group
-            for idx, rp in enumerate(group_members, start=1):
-                rp.age_group_place = idx
-                rp.age_group_points = self.config.calculate_age_group_points(idx)
+            place = group_sizes.get(key, 0) + 1
+            group_sizes[key] = place
+            rp.age_group_place = place
+            rp.age_group_points = age_group_points(place)
 
 
 @dataclass
@@ -292,16 +310,10 @@ class SeriesScoring:
             member_points[race_point.member_id].append(race_point)
 
         # Calculate totals
+        members_by_id = member_registry.index_by_id()
         totals = []
         for member_id, points_list in member_points.items():
-            member = next(
-                (
-                    m
-                    for m in member_registry.get_all_members()
-                    if m.member_id == member_id
-                ),
-                None,
-            )
+            member = members_by_id.get(member_id)
             member_name = member.full_name if member else "Unknown"
 
             # Sort races by total points and take top N races
@@ -355,17 +367,11 @@ class SeriesScoring:
             member_points[race_point.member_id].append(race_point)
 
         # Build category standings
+        members_by_id = member_registry.index_by_id()
         category_standings: dict[str, list[SeriesTotal]] = {}
 
         for member_id, points_list in member_points.items():
-            member = next(
-                (
-                    m
-                    for m in member_registry.get_all_members()
-                    if m.member_id == member_id
-                ),
-                None,
-            )
+            member = members_by_id.get(member_id)
 
             if not member or not member.gender:
                 continue
@@ -10,6 +10,7 @@ from krra_race_series.age_grading import (
     RaceDistance,
     get_age_factor,
     infer_race_distance,
+    parse_times_bulk,
     time_to_seconds,
 )
 from krra_race_series.members import Member
@@ -62,12 +63,53 @@ def test_infer_race_distance_approximate_distances() -> None:
     assert result in [RaceDistance.KM_8, RaceDistance.KM_10]
 
 
+def test_infer_race_distance_uses_whole_number() -> None:
+    """Test that distances like 15K are not mistaken for 5K or 8K."""
+    assert infer_race_distance("river_15k") == RaceDistance.KM_10
+    assert infer_race_distance("trail_18k") == RaceDistance.HALF_MARATHON
+    assert infer_race_distance("road_25k") == RaceDistance.HALF_MARATHON
+
+
+def test_infer_race_distance_keywords_before_numeric_fallback() -> None:
+    """Test that half and marathon win over non-standard numeric tokens."""
+    assert infer_race_distance("Half Marathon 21.1K") == RaceDistance.HALF_MARATHON
+    assert infer_race_distance("half_marathon_21_1k") == RaceDistance.HALF_MARATHON
+    assert infer_race_distance("half_marathon_13k") == RaceDistance.HALF_MARATHON
+    assert infer_race_distance("Marathon 42.2K") == RaceDistance.MARATHON
+    assert infer_race_distance("marathon_42_2k") == RaceDistance.MARATHON
+
+
+def test_infer_race_distance_letter_adjacent_tokens() -> None:
+    """Test that distance tokens joined to words are still recognized."""
+    assert infer_race_distance("Spring5K") == RaceDistance.KM_5
+    assert infer_race_distance("Turkey5K") == RaceDistance.KM_5
+    assert infer_race_distance("Run5K") == RaceDistance.KM_5
+    assert infer_race_distance("5kRun") == RaceDistance.KM_5
+    assert infer_race_distance("fall10k") == RaceDistance.KM_10
+    assert infer_race_distance("spring_5km") == RaceDistance.KM_5
+    # A standard distance wins over other digit-k text in the name
+    assert infer_race_distance("run4kids_10k") == RaceDistance.KM_10
+    assert infer_race_distance("2kool_8k") == RaceDistance.KM_8
+
+
 def test_infer_race_distance_unknown() -> None:
     """Test distance inference for unknown race formats."""
     assert infer_race_distance("unknown_race") is None
     assert infer_race_distance("obstacle_course") is None
 
 
+def test_infer_race_distance_keyword_precedence() -> None:
+    """Test distance inference when a name contains several distance tokens."""
+    assert infer_race_distance("Spring 5K") == RaceDistance.KM_5
+    assert infer_race_distance("Half Marathon") == RaceDistance.HALF_MARATHON
+    assert infer_race_distance("half_mile") == RaceDistance.HALF_MARATHON
+    assert infer_race_distance("mile_and_5k") == RaceDistance.MILE
+    assert infer_race_distance("marathon_relay_10k") == RaceDistance.KM_10
+    assert infer_race_distance("Boston Marathon 2025") == RaceDistance.MARATHON
+    # A number followed by a word starting with "k" is not a distance
+    assert infer_race_distance("2 kids fun run") is None
+
+
 def test_get_age_factor_exact_age() -> None:
     """Test getting age factor for exact age in table."""
     factor_35_male = get_age_factor(RaceDistance.KM_5, 35, "M")
@@ -85,6 +127,14 @@ def test_get_age_factor_interpolation() -> None:
     assert 1.020 < factor_37 < 1.048
 
 
+def test_get_age_factor_interpolation_uses_surrounding_ages() -> None:
+    """Test interpolation brackets the age between its two nearest table ages."""
+    # Age 37 is 2/5 of the way from 35 (1.020) to 40 (1.048)
+    assert get_age_factor(RaceDistance.KM_5, 37, "M") == pytest.approx(1.0312)
+    # Age 84 is 4/5 of the way from 80 (2.088) to 85 (2.458)
+    assert get_age_factor(RaceDistance.KM_5, 84, "M") == pytest.approx(2.384)
+
+
 def test_get_age_factor_edge_cases() -> None:
     """Test age factor for edge cases (very young/old)."""
     # Very young age (below table minimum)
@@ -128,6 +178,12 @@ def test_time_to_seconds_invalid_format() -> None:
         time_to_seconds("invalid")
 
 
+def test_parse_times_bulk() -> None:
+    """Test bulk time conversion matches time_to_seconds and flags bad times."""
+    times = ["18:30", "1:15:30.25", "invalid", "1:2:3:4", "18:xx"]
+    assert parse_times_bulk(times) == [1110.0, 4530.25, None, None, None]
+
+
 def test_age_grading_calculator_initialization() -> None:
     """Test age-grading calculator initialization."""
     calc = AgeGradingCalculator()
@@ -258,6 +314,66 @@ def test_calculate_age_graded_result_invalid_time() -> None:
     assert result is None
 
 
+def test_calculate_age_graded_results_matches_single_calculation() -> None:
+    """Test batch age-grading gives the same results as per-finisher calls."""
+    calc = AgeGradingCalculator()
+
+    members = [
+        Member(
+            member_id="M001", first_name="John", last_name="Doe", age=35, gender="M"
+        ),
+        Member(
+            member_id="M002", first_name="Jane", last_name="Smith", age=52, gender="F"
+        ),
+        Member(member_id="M003", first_name="Bob", last_name="Jones", gender="M"),
+    ]
+    race_results = [
+        RaceResult(place=1, name="John Doe", time="18:30"),
+        RaceResult(place=2, name="Jane Smith", time="22:10"),
+        RaceResult(place=3, name="Bob Jones", time="23:00"),
+    ]
+
+    results = calc.calculate_age_graded_results(members, race_results, "spring_5k")
+
+    # Bob has no age, so only two results are produced
+    assert [r.member_id for r in results] == ["M001", "M002"]
+    for i, result in enumerate(results):
+        assert result == calc.calculate_age_graded_result(
+            members[i], race_results[i], "spring_5k"
+        )
+
+
+def test_calculate_age_graded_results_unknown_distance() -> None:
+    """Test batch age-grading returns no results for unknown distances."""
+    calc = AgeGradingCalculator()
+
+    member = Member(
+        member_id="M001", first_name="John", last_name="Doe", age=35, gender="M"
+    )
+    race_result = RaceResult(place=1, name="John Doe", time="18:30")
+
+    assert calc.calculate_age_graded_results([member], [race_result], "fun_run") == []
+
+
+def test_for_race_scores_finishers() -> None:
+    """Test a race context grades finishers like per-finisher calls."""
+    calc = AgeGradingCalculator()
+
+    race = calc.for_race("summer_8k")
+    assert race is not None
+    assert race.distance == RaceDistance.KM_8
+
+    member = Member(
+        member_id="M001", first_name="John", last_name="Doe", age=41, gender="M"
+    )
+    race_result = RaceResult(place=4, name="John Doe", time="31:05")
+
+    assert race.score(member, race_result) == calc.calculate_age_graded_result(
+        member, race_result, "summer_8k"
+    )
+    assert calc.for_race("fun_run") is None
+
+
 def test_age_graded_result_age_graded_time_calculation() -> None:
     """Test age-graded time calculation from AgeGradedResult."""
     result = AgeGradedResult(
@@ -356,6 +472,42 @@ def test_age_graded_series_scoring_tracks_race_names() -> None:
     assert race_names == ["spring_5k", "summer_8k"]
 
 
+def test_age_graded_results_are_read_only() -> None:
+    """Test that stored results can only change through add_age_graded_results."""
+    scoring = AgeGradedSeriesScoring()
+
+    def result(member_id: str, race_name: str, percentage: float) -> AgeGradedResult:
+        return AgeGradedResult(
+            member_id=member_id,
+            member_name=member_id,
+            race_name=race_name,
+            age=35,
+            gender="M",
+            actual_time="20:00",
+            actual_seconds=1200.0,
+            distance=RaceDistance.KM_5,
+            age_factor=1.0,
+            age_graded_percentage=percentage,
+            overall_place=1,
+        )
+
+    scoring.add_age_graded_results([result("A", "race1", 50.0)])
+
+    with pytest.raises(AttributeError):
+        scoring.all_age_graded_results = [result("B", "race2", 70.0)]  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        scoring.all_age_graded_results[0] = result("B", "race2", 90.0)  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        scoring.all_age_graded_results.clear()  # type: ignore[attr-defined]
+
+    standings = scoring.calculate_age_graded_standings()
+
+    assert [total.member_id for total in standings] == ["A"]
+    assert standings[0].average_age_graded_percentage == 50.0
+    assert standings[0].race_details[0].member_id == "A"
+    assert scoring.get_race_names() == ["race1"]
+
+
 def test_calculate_age_graded_standings_single_member() -> None:
     """Test age-graded standings calculation for a single member."""
     scoring = AgeGradedSeriesScoring()
@@ -584,3 +736,11 @@ def test_age_grading_factors_exist_for_all_distances() -> None:
         assert distance in AGE_GRADING_FACTORS
         assert "M" in AGE_GRADING_FACTORS[distance]
         assert "F" in AGE_GRADING_FACTORS[distance]
+
+
+def test_get_age_factor_matches_table_at_every_listed_age() -> None:
+    """Test that listed ages return their table factor without interpolation."""
+    for distance, gender_factors in AGE_GRADING_FACTORS.items():
+        for gender, factors in gender_factors.items():
+            for age, factor in factors.items():
+                assert get_age_factor(distance, age, gender) == factor
@@ -96,6 +96,32 @@ def test_main_with_categories_filter(tmp_path, sample_members_csv, sample_race_c
     assert not (output_dir / "M_30-39.csv").exists()
 
 
+def test_main_skips_age_grading_when_not_requested(
+    tmp_path, sample_members_csv, sample_race_csv, capsys
+):
+    """Test that age-grading is skipped when not in the categories filter."""
+    output_dir = tmp_path / "results"
+
+    test_args = [
+        "krra-scoring",
+        "--members",
+        str(sample_members_csv),
+        "--races",
+        str(sample_race_csv),
+        "--output",
+        str(output_dir),
+        "--categories",
+        "M_overall",
+    ]
+
+    with patch.object(sys, "argv", test_args):
+        main()
+
+    captured = capsys.readouterr()
+    assert "age-graded results calculated" not in captured.out
+    assert not (output_dir / "age_graded.csv").exists()
+
+
 def test_main_default_output_path(tmp_path, sample_members_csv, sample_race_csv):
     """Test CLI with default output path."""
     # Create the default output directory
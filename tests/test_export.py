@@ -61,6 +61,17 @@ def test_sanitize_csv_field_with_formula_injection():
     assert exporter._sanitize_csv_field("") == ""
 
 
+def test_sanitize_csv_field_with_str_subclass():
+    """Test that str subclasses are sanitized like plain strings."""
+
+    class Name(str):
+        pass
+
+    exporter = ResultsExporter()
+
+    assert exporter._sanitize_csv_field(Name("=SUM(A1)")) == "'=SUM(A1)"
+
+
 def test_export_to_csv_creates_parent_directory(tmp_path):
     """Test that export creates parent directories if they don't exist."""
     exporter = ResultsExporter()
@@ -704,7 +715,7 @@ def test_export_age_graded_standings(tmp_path):
             member_name="John Doe",
             races_completed=2,
             average_age_graded_percentage=95.5,
-            race_details=[],
+            race_details=(),
             race_percentages_by_race={"spring_5k": 94.0, "summer_8k": 97.0},
         ),
         AgeGradedSeriesTotal(
@@ -712,7 +723,7 @@ def test_export_age_graded_standings(tmp_path):
             member_name="Jane Smith",
             races_completed=1,
             average_age_graded_percentage=98.2,
-            race_details=[],
+            race_details=(),
             race_percentages_by_race={"spring_5k": 98.2},
         ),
     ]
@@ -768,7 +779,7 @@ def test_export_age_graded_standings_creates_directory(tmp_path):
             member_name="John Doe",
             races_completed=1,
             average_age_graded_percentage=95.5,
-            race_details=[],
+            race_details=(),
             race_percentages_by_race={"spring_5k": 95.5},
         ),
     ]
@@ -818,7 +829,7 @@ def test_export_age_graded_standings_without_race_names(tmp_path):
             member_name="John Doe",
             races_completed=2,
             average_age_graded_percentage=95.5,
-            race_details=[],
+            race_details=(),
         ),
     ]
 
@@ -54,3 +54,19 @@ def test_match_all():
     assert matches[0].matched is True
     assert matches[1].matched is False
     assert matches[2].matched is True
+
+
+def test_match_all_with_prebuilt_index():
+    """Test matching with a name index shared across races."""
+    registry = MemberRegistry()
+    member = Member(member_id="M001", first_name="John", last_name="Doe")
+    registry.members = [member]
+
+    matcher = FinisherMatcher(registry)
+    members_by_name = registry.index_by_name()
+
+    for name in ["John Doe", "  JOHN DOE "]:
+        matches = matcher.match_all(
+            [RaceResult(place=1, name=name, time="18:30")], members_by_name
+        )
+        assert matches[0].member is member
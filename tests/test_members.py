@@ -1,5 +1,6 @@
 """Tests for members module."""
 
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
 import pytest
@@ -17,6 +18,38 @@ def test_member_creation():
     assert member.full_name == "John Doe"
 
 
+def test_member_name_key_and_equality():
+    """Test the cached name key and that it is excluded from equality."""
+    member = Member(member_id="M001", first_name="José", last_name="DOE")
+
+    assert member.name_key == "jose doe"
+    assert member == Member(member_id="M001", first_name="José", last_name="DOE")
+    assert "_name_key" not in repr(member)
+
+
+def test_member_names_are_fixed():
+    """Test that names can't change after the lookup key is derived."""
+    member = Member(member_id="M001", first_name="John", last_name="Doe")
+
+    with pytest.raises(FrozenInstanceError):
+        member.first_name = "Jane"  # type: ignore[misc]
+
+    assert member.full_name == "John Doe"
+    assert member.name_key == "john doe"
+
+
+def test_find_by_name_ignores_accents():
+    """Test that name lookups ignore accents in either name."""
+    registry = MemberRegistry()
+    registry.members = [
+        Member(member_id="M001", first_name="José", last_name="Núñez"),
+        Member(member_id="M002", first_name="Zoe", last_name="Smith"),
+    ]
+
+    assert registry.find_by_name("Jose Nunez").member_id == "M001"
+    assert registry.find_by_name("ZOË SMITH").member_id == "M002"
+
+
 def test_member_registry_find_by_name():
     """Test finding a member by name."""
     registry = MemberRegistry()
@@ -142,6 +175,47 @@ def test_get_all_members():
     assert len(registry.members) == 2
 
 
+def test_index_by_name_keeps_first_member_per_name():
+    """Test the name index is case-insensitive and keeps the first duplicate."""
+    registry = MemberRegistry()
+
+    member1 = Member(member_id="M001", first_name="John", last_name="Doe")
+    member2 = Member(member_id="M002", first_name="JOHN", last_name="DOE")
+    registry.members = [member1, member2]
+
+    index = registry.index_by_name()
+
+    assert list(index) == ["john doe"]
+    assert index["john doe"] is member1
+    assert index["john doe"] is registry.find_by_name("John Doe")
+    # The index is cached between calls
+    assert registry.index_by_name() is index
+
+
+def test_index_by_id_keeps_first_member_per_id():
+    """Test the ID index keeps the first duplicate and follows replacements."""
+    registry = MemberRegistry()
+
+    member1 = Member(member_id="M001", first_name="John", last_name="Doe")
+    member2 = Member(member_id="M001", first_name="Jane", last_name="Smith")
+    registry.members = [member1, member2]
+
+    index = registry.index_by_id()
+
+    assert index == {"M001": member1}
+    assert index["M001"] is member1
+    # The index is cached between calls
+    assert registry.index_by_id() is index
+
+    registry.members = [member2]
+    assert registry.index_by_id()["M001"] is member2
+
+    # Same-length replacement must not reuse the old index
+    member3 = Member(member_id="M002", first_name="Bob", last_name="Lee")
+    registry.members = [member3]
+    assert registry.index_by_id() == {"M002": member3}
+
+
 def test_find_by_name_with_whitespace():
     """Test finding a member by name with extra whitespace."""
     registry = MemberRegistry()
@@ -152,3 +226,44 @@ def test_find_by_name_with_whitespace():
     found = registry.find_by_name("  John Doe  ")
     assert found is not None
     assert found.member_id == "M001"
+
+
+def test_find_by_name_sees_added_and_replaced_members():
+    """Test name lookups stay current when the member list changes."""
+    registry = MemberRegistry()
+    registry.members = [Member(member_id="M001", first_name="John", last_name="Doe")]
+    assert registry.find_by_name("Jane Smith") is None
+
+    registry.members = [
+        *registry.members,
+        Member(member_id="M002", first_name="Jane", last_name="Smith"),
+    ]
+    found = registry.find_by_name("Jane Smith")
+    assert found is not None
+    assert found.member_id == "M002"
+
+    registry.members = [Member(member_id="M003", first_name="Bob", last_name="Lee")]
+    assert registry.find_by_name("John Doe") is None
+    assert registry.find_by_name("bob lee") is not None
+
+
+def test_find_by_name_after_same_length_replacement():
+    """Test name lookups drop members replaced by a list of the same length."""
+    registry = MemberRegistry()
+    registry.members = [Member(member_id="M001", first_name="John", last_name="Doe")]
+    assert registry.find_by_name("John Doe") is not None
+
+    registry.members = [Member(member_id="M002", first_name="Jane", last_name="Smith")]
+
+    assert registry.find_by_name("John Doe") is None
+    found = registry.find_by_name("Jane Smith")
+    assert found is not None
+    assert found.member_id == "M002"
+
+
+def test_members_are_read_only():
+    """Test the members can't be edited in place behind the cached lookups."""
+    registry = MemberRegistry()
+    registry.members = [Member(member_id="M001", first_name="John", last_name="Doe")]
+
+    assert isinstance(registry.members, tuple)
@@ -111,3 +111,23 @@ def test_load_csv_race_name_from_filename(tmp_path):
     race = loader.load_csv(csv_path)
 
     assert race.name == "summer_marathon_2024"
+
+
+def test_load_csv_maps_columns_by_header(tmp_path):
+    """Test that columns are read by header name, skipping blank lines."""
+    loader = RaceResultsLoader()
+
+    # Reordered columns, no age or bib_number, and a blank line
+    csv_path = tmp_path / "race.csv"
+    csv_path.write_text("time,name,place,gender\n18:30,John Doe,1,M\n\n19:45,Jane,2\n")
+
+    race = loader.load_csv(csv_path)
+
+    assert len(race.results) == 2
+    assert race.results[0].place == 1
+    assert race.results[0].name == "John Doe"
+    assert race.results[0].time == "18:30"
+    assert race.results[0].age is None
+    assert race.results[0].bib_number is None
+    assert race.results[1].place == 2
+    assert race.results[1].gender == ""
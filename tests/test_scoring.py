@@ -1,5 +1,9 @@
 """Tests for scoring module."""
 
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from krra_race_series.matching import MatchResult
 from krra_race_series.members import Member, MemberRegistry
 from krra_race_series.race_results import RaceResult
@@ -27,6 +31,16 @@ def test_age_group_categorization():
     assert AgeGroup.from_age(None) is None
 
 
+def test_age_group_boundaries():
+    """Test age group boundaries at each decade and beyond 80."""
+    assert AgeGroup.from_age(0) == AgeGroup.UNDER_20
+    assert AgeGroup.from_age(39) == AgeGroup.AGE_30_39
+    assert AgeGroup.from_age(40) == AgeGroup.AGE_40_49
+    assert AgeGroup.from_age(79) == AgeGroup.AGE_70_79
+    assert AgeGroup.from_age(80) == AgeGroup.AGE_80_PLUS
+    assert AgeGroup.from_age(104) == AgeGroup.AGE_80_PLUS
+
+
 def test_overall_points_calculation_75_race():
     """Test overall points calculation for 75-point races."""
     config = PointsConfig(race_type=RaceType.RACE_75)
@@ -57,6 +71,17 @@ def test_overall_points_calculation_100_race():
     assert config.calculate_overall_points(100) == 1
 
 
+def test_points_config_race_type_is_fixed():
+    """Test that race_type can't change after the points tables are built."""
+    config = PointsConfig(race_type=RaceType.RACE_75)
+
+    with pytest.raises(FrozenInstanceError):
+        config.race_type = RaceType.RACE_100  # type: ignore[misc]
+
+    assert config.calculate_overall_points(1) == 75
+    assert config == PointsConfig(race_type=RaceType.RACE_75)
+
+
 def test_age_group_points_75_race():
     """Test age group points for 75-point races."""
     config = PointsConfig(race_type=RaceType.RACE_75)